@@ -20,8 +20,29 @@ try:
 except ImportError:
     from importlib_metadata import PackageNotFoundError, version  # python 3.6 and 3.7
 
-# Import modules
-from . import core, image, linalg, postprocessing, sensors
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from . import core
+
+if TYPE_CHECKING:
+    from . import image, linalg, postprocessing, sensors
+
+# Subpackages pulling in heavy dependencies (OpenCV, SciPy, ...) are imported
+# on first attribute access (PEP 562), so `import nextcv` stays cheap
+_LAZY_SUBMODULES = ("image", "linalg", "postprocessing", "sensors")
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
+
 
 try:
     __version__ = version("nextcv")
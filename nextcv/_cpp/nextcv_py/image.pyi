@@ -7,9 +7,83 @@ import typing
 import numpy
 import numpy.typing
 
-__all__: list[str] = ["invert"]
+__all__: list[str] = ["BLEND_WEIGHT_SHIFT", "blend_add", "invert", "remap_bilinear"]
+
+@typing.overload
+def blend_add(
+    canvas: numpy.typing.NDArray[numpy.uint8],
+    image: numpy.typing.NDArray[numpy.uint8],
+    weights: numpy.typing.NDArray[numpy.float32],
+    x: typing.SupportsInt | typing.SupportsIndex,
+    y: typing.SupportsInt | typing.SupportsIndex,
+    offset: typing.SupportsFloat | typing.SupportsIndex = 0.0,
+) -> None:
+    """Accumulate (image + offset) * weights into canvas at (x, y) in place."""
+
+@typing.overload
+def blend_add(
+    canvas: numpy.typing.NDArray[numpy.uint16],
+    image: numpy.typing.NDArray[numpy.uint16],
+    weights: numpy.typing.NDArray[numpy.float32],
+    x: typing.SupportsInt | typing.SupportsIndex,
+    y: typing.SupportsInt | typing.SupportsIndex,
+    offset: typing.SupportsFloat | typing.SupportsIndex = 0.0,
+) -> None:
+    """Accumulate (image + offset) * weights into canvas at (x, y) in place."""
+
+@typing.overload
+def blend_add(
+    canvas: numpy.typing.NDArray[numpy.float32],
+    image: numpy.typing.NDArray[numpy.float32],
+    weights: numpy.typing.NDArray[numpy.float32],
+    x: typing.SupportsInt | typing.SupportsIndex,
+    y: typing.SupportsInt | typing.SupportsIndex,
+    offset: typing.SupportsFloat | typing.SupportsIndex = 0.0,
+) -> None:
+    """Accumulate (image + offset) * weights into canvas at (x, y) in place."""
+
+@typing.overload
+def blend_add(
+    canvas: numpy.typing.NDArray[numpy.uint8],
+    image: numpy.typing.NDArray[numpy.uint8],
+    weights: numpy.typing.NDArray[numpy.uint16],
+    x: typing.SupportsInt | typing.SupportsIndex,
+    y: typing.SupportsInt | typing.SupportsIndex,
+    offset: typing.SupportsFloat | typing.SupportsIndex = 0.0,
+) -> None:
+    """Accumulate (image + offset) * weights into canvas at (x, y) in place."""
+
+@typing.overload
+def blend_add(
+    canvas: numpy.typing.NDArray[numpy.uint16],
+    image: numpy.typing.NDArray[numpy.uint16],
+    weights: numpy.typing.NDArray[numpy.uint16],
+    x: typing.SupportsInt | typing.SupportsIndex,
+    y: typing.SupportsInt | typing.SupportsIndex,
+    offset: typing.SupportsFloat | typing.SupportsIndex = 0.0,
+) -> None:
+    """Accumulate (image + offset) * weights into canvas at (x, y) in place."""
 
 def invert(
-    arg0: typing.Annotated[numpy.typing.ArrayLike, numpy.uint8],
+    image: typing.Annotated[numpy.typing.ArrayLike, numpy.uint8],
+    out: numpy.typing.NDArray[numpy.uint8] | None = None,
 ) -> numpy.typing.NDArray[numpy.uint8]:
     """Invert n-dimensional array of 8-bit pixels, preserving shape."""
+
+@typing.overload
+def remap_bilinear(
+    src: numpy.typing.NDArray[numpy.uint8],
+    xy: numpy.typing.NDArray[numpy.int16],
+    fractions: numpy.typing.NDArray[numpy.uint16],
+) -> numpy.typing.NDArray[numpy.uint8]:
+    """Bilinearly remap a 2D image with fixed-point maps, replicating the border."""
+
+@typing.overload
+def remap_bilinear(
+    src: numpy.typing.NDArray[numpy.uint16],
+    xy: numpy.typing.NDArray[numpy.int16],
+    fractions: numpy.typing.NDArray[numpy.uint16],
+) -> numpy.typing.NDArray[numpy.uint16]:
+    """Bilinearly remap a 2D image with fixed-point maps, replicating the border."""
+
+BLEND_WEIGHT_SHIFT: int = 15
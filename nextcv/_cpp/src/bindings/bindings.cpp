@@ -1,7 +1,9 @@
 #include <Eigen/Core>
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
 #include <cstdint>
-#include <cstring>
-#include <pybind11/buffer_info.h>
+#include <optional>
 #include <pybind11/detail/common.h>
 #include <pybind11/eigen.h>
 #include <pybind11/numpy.h>
@@ -10,10 +12,13 @@
 #include <pybind11/stl.h>
 #include <stdexcept>
 #include <string>
+#include <type_traits>
 #include <vector>
 
 #include "../core/hello.hpp"
+#include "../image/blend.hpp"
 #include "../image/invert.hpp"
+#include "../image/remap.hpp"
 #include "../linalg/matvec.hpp"
 #include "../postprocessing/nms.hpp"
 #include "../postprocessing/wbf.hpp"
@@ -22,28 +27,108 @@ namespace py = pybind11;
 
 namespace {
 
-auto invert(const py::array_t<std::uint8_t>& input) -> py::array_t<std::uint8_t> {
-    // Get buffer info from numpy array
-    py::buffer_info buf_info = input.request();
-
+auto invert(const py::array_t<std::uint8_t>& input,
+            std::optional<py::array_t<std::uint8_t, py::array::c_style>> out)
+    -> py::array_t<std::uint8_t> {
     // Ensure array is C-contiguous for efficient processing
     if ((input.flags() & py::array::c_style) == 0) {
         throw std::runtime_error("Input array must be C-contiguous");
     }
 
-    // Convert to std::vector for processing (flattened view)
-    std::vector<std::uint8_t> pixels(static_cast<std::uint8_t*>(buf_info.ptr),
-                                     static_cast<std::uint8_t*>(buf_info.ptr) + buf_info.size);
+    // Write straight into the output array (new, or caller-provided)
+    using Array = py::array_t<std::uint8_t, py::array::c_style>;
+    Array result = out ? *out : Array(std::vector<py::ssize_t>(input.shape(),
+                                                              input.shape() + input.ndim()));
+    if (!std::equal(input.shape(), input.shape() + input.ndim(), result.shape(),
+                    result.shape() + result.ndim())) {
+        throw std::invalid_argument("out must have the same shape as the input");
+    }
 
-    // Apply inversion
-    auto inverted = nextcv::image::invert(pixels);
+    const std::uint8_t* src = input.data();
+    std::uint8_t* dst = result.mutable_data();
+    const auto size = static_cast<std::size_t>(input.size());
+    {
+        py::gil_scoped_release release;
+        nextcv::image::invert(src, dst, size);
+    }
+    return result;
+}
 
-    // Create output numpy array with same shape as input
-    py::array_t<std::uint8_t> result(buf_info.shape);
-    py::buffer_info result_buf = result.request();
-    std::memcpy(result_buf.ptr, inverted.data(), inverted.size() * sizeof(std::uint8_t));
+template <typename T, typename W>
+void blendAdd(py::array_t<T, py::array::c_style>& canvas,
+              const py::array_t<T, py::array::c_style>& image,
+              const py::array_t<W, py::array::c_style>& weights, py::ssize_t x, py::ssize_t y,
+              double offset) {
+    if (canvas.ndim() != 2 || image.ndim() != 2 || weights.ndim() != 2) {
+        throw std::invalid_argument("canvas, image and weights must be 2D arrays");
+    }
+    if (image.shape(0) != weights.shape(0) || image.shape(1) != weights.shape(1)) {
+        throw std::invalid_argument("image and weights must have the same shape");
+    }
+    const py::ssize_t rows = image.shape(0);
+    const py::ssize_t cols = image.shape(1);
+    if (x < 0 || y < 0 || y + rows > canvas.shape(0) || x + cols > canvas.shape(1)) {
+        throw std::invalid_argument("image region does not fit inside canvas");
+    }
+    if (rows == 0 || cols == 0) {
+        return;
+    }
 
-    return result;
+    T* dst = canvas.mutable_data(y, x);
+    const py::ssize_t stride = canvas.shape(1);
+    py::gil_scoped_release release;
+    if constexpr (std::is_same_v<W, std::uint16_t>) {
+        // Fixed-point weights pair with an integer offset, rounded to nearest;
+        // anything beyond one 16-bit pixel range saturates the same way
+        const auto int_offset =
+            static_cast<std::int32_t>(std::lround(std::clamp(offset, -65536.0, 65536.0)));
+        nextcv::image::blendAdd<T>(dst, stride, image.data(), weights.data(), rows, cols,
+                                   int_offset);
+    } else {
+        nextcv::image::blendAdd<T>(dst, stride, image.data(), weights.data(), rows, cols,
+                                   static_cast<float>(offset));
+    }
+}
+
+template <typename T, typename W> void defBlendAdd(py::module_& module) {
+    // noconvert: the canvas is updated in place, so it must never be a converted copy
+    module.def("blend_add", &blendAdd<T, W>, py::arg("canvas").noconvert(),
+               py::arg("image").noconvert(), py::arg("weights").noconvert(), py::arg("x"),
+               py::arg("y"), py::arg("offset") = 0.0,
+               "Accumulate (image + offset) * weights into canvas at (x, y) in place");
+}
+
+template <typename T>
+auto remapBilinear(const py::array_t<T, py::array::c_style>& src,
+                   const py::array_t<std::int16_t, py::array::c_style>& xy,
+                   const py::array_t<std::uint16_t, py::array::c_style>& fractions)
+    -> py::array_t<T> {
+    if (src.ndim() != 2 || src.shape(0) == 0 || src.shape(1) == 0) {
+        throw std::invalid_argument("src must be a non-empty 2D array");
+    }
+    if (xy.ndim() != 3 || fractions.ndim() != 2 || xy.shape(2) != 2 ||
+        xy.shape(0) != fractions.shape(0) || xy.shape(1) != fractions.shape(1)) {
+        throw std::invalid_argument("maps must be (h, w, 2) int16 and (h, w) uint16 arrays");
+    }
+
+    py::array_t<T> dst({fractions.shape(0), fractions.shape(1)});
+    const T* src_ptr = src.data();
+    const std::int16_t* xy_ptr = xy.data();
+    const std::uint16_t* fractions_ptr = fractions.data();
+    T* dst_ptr = dst.mutable_data();
+    const auto size = static_cast<std::size_t>(fractions.size());
+    {
+        py::gil_scoped_release release;
+        nextcv::image::remapBilinear<T>(src_ptr, src.shape(0), src.shape(1), xy_ptr,
+                                        fractions_ptr, dst_ptr, size);
+    }
+    return dst;
+}
+
+template <typename T> void defRemapBilinear(py::module_& module) {
+    module.def("remap_bilinear", &remapBilinear<T>, py::arg("src").noconvert(),
+               py::arg("xy").noconvert(), py::arg("fractions").noconvert(),
+               "Bilinearly remap a 2D image with fixed-point maps, replicating the border");
 }
 
 } // namespace
@@ -57,12 +142,25 @@ PYBIND11_MODULE(nextcv_py, module) {
 
     // Image processing submodule
     auto image = module.def_submodule("image", "Image processing utilities");
-    image.def("invert", &invert, "Invert n-dimensional array of 8-bit pixels, preserving shape");
+    // noconvert: out is written in place, so it must never be a converted copy
+    image.def("invert", &invert, py::arg("image"), py::arg("out").noconvert() = py::none(),
+              "Invert n-dimensional array of 8-bit pixels, preserving shape");
+    defBlendAdd<std::uint8_t, float>(image);
+    defBlendAdd<std::uint16_t, float>(image);
+    defBlendAdd<float, float>(image);
+    defBlendAdd<std::uint8_t, std::uint16_t>(image);
+    defBlendAdd<std::uint16_t, std::uint16_t>(image);
+    image.attr("BLEND_WEIGHT_SHIFT") = nextcv::image::blend_weight_shift;
+    defRemapBilinear<std::uint8_t>(image);
+    defRemapBilinear<std::uint16_t>(image);
 
     // Post-processing submodule
     auto postprocessing = module.def_submodule("postprocessing", "Post-processing utilities");
+    // Heavy kernels take converted copies / views, so they run without the GIL
+    // and scale across Python threads
     postprocessing.def("nms", &nextcv::postprocessing::nms, py::arg("bboxes"), py::arg("scores"),
                        py::arg("threshold") = nextcv::postprocessing::default_nms_threshold,
+                       py::call_guard<py::gil_scoped_release>(),
                        "Apply Non-Maximum Suppression to bounding boxes (numpy arrays)");
     const auto wbfBinding = [](const std::vector<nextcv::postprocessing::ModelBoxes>& boxes_list,
                                const std::vector<nextcv::postprocessing::ModelScores>& scores_list,
@@ -81,7 +179,8 @@ PYBIND11_MODULE(nextcv_py, module) {
         py::arg("iou_thr") = nextcv::postprocessing::default_wbf_iou_threshold,
         py::arg("skip_box_thr") = nextcv::postprocessing::default_wbf_skip_box_threshold,
         py::arg("conf_type") = std::string(nextcv::postprocessing::default_wbf_conf_type),
-        py::arg("allows_overflow") = false, "Apply Weighted Box Fusion to per-model detections");
+        py::arg("allows_overflow") = false, py::call_guard<py::gil_scoped_release>(),
+        "Apply Weighted Box Fusion to per-model detections");
 
     // Linear algebra submodule
     auto linalg = module.def_submodule("linalg", "Linear algebra utilities");
@@ -93,6 +192,6 @@ PYBIND11_MODULE(nextcv_py, module) {
            const Eigen::Ref<const Eigen::VectorXf>& vector) -> Eigen::VectorXf {
             return nextcv::linalg::matvec(matrix, vector);
         },
-        py::arg("matrix"), py::arg("vector"),
+        py::arg("matrix"), py::arg("vector"), py::call_guard<py::gil_scoped_release>(),
         R"doc(Multiply matrix (MxN) by vector (N) → y (M). Uses Eigen.)doc");
 }
@@ -0,0 +1,74 @@
+#include "blend.hpp"
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <type_traits>
+
+namespace nextcv::image {
+
+namespace {
+
+template <typename T> auto saturateCast(float value) -> T {
+    if constexpr (std::is_integral_v<T>) {
+        value = std::clamp(value, static_cast<float>(std::numeric_limits<T>::lowest()),
+                           static_cast<float>(std::numeric_limits<T>::max()));
+    }
+    return static_cast<T>(value);
+}
+
+} // namespace
+
+template <typename T>
+void blendAdd(T* canvas, std::ptrdiff_t canvas_stride, const T* image, const float* weights,
+              std::ptrdiff_t rows, std::ptrdiff_t cols, float offset) {
+    for (std::ptrdiff_t row = 0; row < rows; ++row) {
+        T* dst = canvas + (row * canvas_stride);
+        const T* src = image + (row * cols);
+        const float* weight = weights + (row * cols);
+        for (std::ptrdiff_t col = 0; col < cols; ++col) {
+            const float pixel = static_cast<float>(saturateCast<T>(src[col] + offset));
+            const float value = static_cast<float>(dst[col]) + (pixel * weight[col]);
+            dst[col] = saturateCast<T>(value);
+        }
+    }
+}
+
+template <typename T>
+void blendAdd(T* canvas, std::ptrdiff_t canvas_stride, const T* image,
+              const std::uint16_t* weights, std::ptrdiff_t rows, std::ptrdiff_t cols,
+              std::int32_t offset) {
+    // Products stay below 2^32 for any 16-bit pixel and weight
+    constexpr std::uint32_t half = 1U << (blend_weight_shift - 1);
+    constexpr std::uint32_t max_value = std::numeric_limits<T>::max();
+    // Keep the offset within one pixel range so the sums below cannot overflow
+    offset = std::clamp<std::int32_t>(offset, -static_cast<std::int32_t>(max_value),
+                                      static_cast<std::int32_t>(max_value));
+    for (std::ptrdiff_t row = 0; row < rows; ++row) {
+        T* dst = canvas + (row * canvas_stride);
+        const T* src = image + (row * cols);
+        const std::uint16_t* weight = weights + (row * cols);
+        for (std::ptrdiff_t col = 0; col < cols; ++col) {
+            const auto pixel = static_cast<std::uint32_t>(std::clamp<std::int32_t>(
+                src[col] + offset, 0, static_cast<std::int32_t>(max_value)));
+            const std::uint32_t value =
+                dst[col] + ((pixel * weight[col] + half) >> blend_weight_shift);
+            dst[col] = static_cast<T>(std::min(value, max_value));
+        }
+    }
+}
+
+template void blendAdd<std::uint8_t>(std::uint8_t*, std::ptrdiff_t, const std::uint8_t*,
+                                     const float*, std::ptrdiff_t, std::ptrdiff_t, float);
+template void blendAdd<std::uint16_t>(std::uint16_t*, std::ptrdiff_t, const std::uint16_t*,
+                                      const float*, std::ptrdiff_t, std::ptrdiff_t, float);
+template void blendAdd<float>(float*, std::ptrdiff_t, const float*, const float*, std::ptrdiff_t,
+                              std::ptrdiff_t, float);
+template void blendAdd<std::uint8_t>(std::uint8_t*, std::ptrdiff_t, const std::uint8_t*,
+                                     const std::uint16_t*, std::ptrdiff_t, std::ptrdiff_t,
+                                     std::int32_t);
+template void blendAdd<std::uint16_t>(std::uint16_t*, std::ptrdiff_t, const std::uint16_t*,
+                                      const std::uint16_t*, std::ptrdiff_t, std::ptrdiff_t,
+                                      std::int32_t);
+
+} // namespace nextcv::image
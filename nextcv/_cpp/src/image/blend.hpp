@@ -0,0 +1,51 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace nextcv::image {
+
+// Fractional bits of fixed-point blending weights (Q1.15: 1.0 == 1 << 15)
+constexpr int blend_weight_shift = 15;
+
+/**
+ * @brief Accumulate a weighted image into a canvas region in a single pass
+ *
+ * Computes canvas = saturate(canvas + (image + offset) * weights) per pixel in
+ * float32. For integer pixels the offset image is clamped to the pixel range
+ * first; integer results are clamped to the pixel range and truncated.
+ *
+ * @param canvas Pointer to the top-left pixel of the canvas region
+ * @param canvas_stride Canvas row stride in pixels
+ * @param image Row-major image pixels (rows x cols)
+ * @param weights Row-major blending weights (rows x cols)
+ * @param rows Number of rows in the region
+ * @param cols Number of columns in the region
+ * @param offset Constant added to every image pixel before weighting
+ */
+template <typename T>
+void blendAdd(T* canvas, std::ptrdiff_t canvas_stride, const T* image, const float* weights,
+              std::ptrdiff_t rows, std::ptrdiff_t cols, float offset = 0.0F);
+
+/**
+ * @brief Accumulate an image weighted by fixed-point weights into a canvas region
+ *
+ * Integer-only variant of blendAdd for 8/16-bit pixels: weights are Q1.15
+ * (see blend_weight_shift), products are rounded to nearest and results
+ * saturate at the pixel maximum. Half the weight bandwidth of float32. The
+ * integer offset is added to the image, clamped to the pixel range, first.
+ *
+ * @param canvas Pointer to the top-left pixel of the canvas region
+ * @param canvas_stride Canvas row stride in pixels
+ * @param image Row-major image pixels (rows x cols)
+ * @param weights Row-major Q1.15 blending weights (rows x cols)
+ * @param rows Number of rows in the region
+ * @param cols Number of columns in the region
+ * @param offset Constant added to every image pixel before weighting
+ */
+template <typename T>
+void blendAdd(T* canvas, std::ptrdiff_t canvas_stride, const T* image,
+              const std::uint16_t* weights, std::ptrdiff_t rows, std::ptrdiff_t cols,
+              std::int32_t offset = 0);
+
+} // namespace nextcv::image
@@ -1,22 +1,21 @@
 #include "invert.hpp"
 #include "../core/types.hpp"
 #include <algorithm>
-#include <iterator>
+#include <cstddef>
 #include <limits>
 
 namespace nextcv::image {
 
 auto invert(const core::PixelVector& pixels) -> core::PixelVector {
-    core::PixelVector out;
-    out.reserve(pixels.size());
-
-    std::transform(pixels.begin(), pixels.end(), std::back_inserter(out),
-                   [](core::Pixel pixel) -> core::Pixel {
-                       return static_cast<core::Pixel>(std::numeric_limits<core::Pixel>::max() -
-                                                       pixel);
-                   });
-
+    core::PixelVector out(pixels.size());
+    invert(pixels.data(), out.data(), pixels.size());
     return out;
 }
 
+void invert(const core::Pixel* pixels, core::Pixel* out, std::size_t size) {
+    std::transform(pixels, pixels + size, out, [](core::Pixel pixel) -> core::Pixel {
+        return static_cast<core::Pixel>(std::numeric_limits<core::Pixel>::max() - pixel);
+    });
+}
+
 } // namespace nextcv::image
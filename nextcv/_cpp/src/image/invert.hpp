@@ -1,6 +1,7 @@
 #pragma once
 
 #include "../core/types.hpp"
+#include <cstddef>
 
 namespace nextcv::image {
 
@@ -11,4 +12,12 @@ namespace nextcv::image {
  */
 auto invert(const core::PixelVector& pixels) -> core::PixelVector;
 
+/**
+ * @brief Invert pixel values from one buffer into another
+ * @param pixels Input pixel data
+ * @param out Output pixel data (may alias pixels)
+ * @param size Number of pixels
+ */
+void invert(const core::Pixel* pixels, core::Pixel* out, std::size_t size);
+
 } // namespace nextcv::image
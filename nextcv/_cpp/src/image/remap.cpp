@@ -0,0 +1,53 @@
+#include "remap.hpp"
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+
+namespace nextcv::image {
+
+template <typename T>
+void remapBilinear(const T* src, std::ptrdiff_t src_rows, std::ptrdiff_t src_cols,
+                   const std::int16_t* xy, const std::uint16_t* fractions, T* dst,
+                   std::size_t size) {
+    constexpr std::uint32_t scale = 1U << remap_fraction_bits;
+    constexpr std::uint32_t mask = scale - 1;
+    constexpr std::uint32_t half = 1U << ((2 * remap_fraction_bits) - 1);
+    const std::ptrdiff_t max_x = src_cols - 1;
+    const std::ptrdiff_t max_y = src_rows - 1;
+
+    for (std::size_t i = 0; i < size; ++i) {
+        const std::ptrdiff_t x = xy[2 * i];
+        const std::ptrdiff_t y = xy[(2 * i) + 1];
+
+        const T* row0 = nullptr;
+        const T* row1 = nullptr;
+        std::ptrdiff_t x0 = x;
+        std::ptrdiff_t x1 = x + 1;
+        if (x >= 0 && x < max_x && y >= 0 && y < max_y) {
+            row0 = src + (y * src_cols);
+            row1 = row0 + src_cols;
+        } else {
+            // Clamping each corner replicates the border and keeps reads in bounds
+            x0 = std::clamp(x0, std::ptrdiff_t{0}, max_x);
+            x1 = std::clamp(x1, std::ptrdiff_t{0}, max_x);
+            row0 = src + (std::clamp(y, std::ptrdiff_t{0}, max_y) * src_cols);
+            row1 = src + (std::clamp(y + 1, std::ptrdiff_t{0}, max_y) * src_cols);
+        }
+
+        const std::uint32_t fx = fractions[i] & mask;
+        const std::uint32_t fy = (fractions[i] >> remap_fraction_bits) & mask;
+        const std::uint32_t top = (row0[x0] * (scale - fx)) + (row0[x1] * fx);
+        const std::uint32_t bottom = (row1[x0] * (scale - fx)) + (row1[x1] * fx);
+        dst[i] = static_cast<T>(((top * (scale - fy)) + (bottom * fy) + half) >>
+                                (2 * remap_fraction_bits));
+    }
+}
+
+template void remapBilinear<std::uint8_t>(const std::uint8_t*, std::ptrdiff_t, std::ptrdiff_t,
+                                          const std::int16_t*, const std::uint16_t*,
+                                          std::uint8_t*, std::size_t);
+template void remapBilinear<std::uint16_t>(const std::uint16_t*, std::ptrdiff_t, std::ptrdiff_t,
+                                           const std::int16_t*, const std::uint16_t*,
+                                           std::uint16_t*, std::size_t);
+
+} // namespace nextcv::image
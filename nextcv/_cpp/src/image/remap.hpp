@@ -0,0 +1,32 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+namespace nextcv::image {
+
+// Sub-pixel bits of fixed-point remap maps (OpenCV's INTER_BITS)
+constexpr int remap_fraction_bits = 5;
+
+/**
+ * @brief Bilinearly remap a single-channel image with fixed-point maps
+ *
+ * Maps use OpenCV's fixed-point layout (cv2.convertMaps to CV_16SC2): an
+ * integer source (x, y) pair plus a (fy << 5 | fx) sub-pixel index per output
+ * pixel. Samples outside the source replicate its border. Interpolation is
+ * done in integer arithmetic and rounded to nearest.
+ *
+ * @param src Row-major source pixels
+ * @param src_rows Number of source rows
+ * @param src_cols Number of source columns
+ * @param xy Integer source coordinates, one (x, y) pair per output pixel
+ * @param fractions Sub-pixel index per output pixel
+ * @param dst Output pixels
+ * @param size Number of output pixels
+ */
+template <typename T>
+void remapBilinear(const T* src, std::ptrdiff_t src_rows, std::ptrdiff_t src_cols,
+                   const std::int16_t* xy, const std::uint16_t* fractions, T* dst,
+                   std::size_t size);
+
+} // namespace nextcv::image
@@ -1,6 +1,37 @@
 """NextCV Image module - Image processing functionality."""
 
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING, Union
+
+from .compose import blend_add, quantize_blend_weights
+from .geometry import remap_bilinear
 from .ops import invert
-from .stitching import LeftRightStitcher
 
-__all__ = ["invert", "LeftRightStitcher"]
+if TYPE_CHECKING:
+    from . import stitching as stitching
+    from .stitching import LeftRightStitcher
+
+__all__ = [
+    "blend_add",
+    "invert",
+    "quantize_blend_weights",
+    "remap_bilinear",
+    "LeftRightStitcher",
+]
+
+# Submodules pulling in OpenCV and SciPy are imported on first attribute
+# access (PEP 562), so `import nextcv.image` stays cheap
+_LAZY_SUBMODULES = ("stitching",)
+
+
+def __getattr__(name: str) -> Union[ModuleType, type]:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "LeftRightStitcher":
+        return importlib.import_module(".stitching", __name__).LeftRightStitcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | {"LeftRightStitcher"})
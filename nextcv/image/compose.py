@@ -10,3 +10,45 @@ Includes operations like:
 These functions typically perform geometric alignment, warping,
 and optional seam blending to produce seamless composites.
 """
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from nextcv._cpp.nextcv_py.image import BLEND_WEIGHT_SHIFT
+from nextcv._cpp.nextcv_py.image import blend_add as _blend_add
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def blend_add(  # noqa: PLR0913, PLR0917
+    canvas: "NDArray[np.generic]",
+    image: "NDArray[np.generic]",
+    weights: "NDArray[np.float32] | NDArray[np.uint16]",
+    x: int,
+    y: int,
+    offset: float = 0.0,
+) -> None:
+    """Accumulate ``(image + offset) * weights`` into ``canvas`` at (x, y), in place.
+
+    Offset, multiply, add and saturating cast are fused into a single pass
+    over the region. ``canvas`` and ``image`` must be C-contiguous 2D arrays
+    of the same dtype (uint8, uint16 or float32); ``weights`` has the shape of
+    ``image`` and is either float32 or, for integer images, fixed-point
+    weights from :func:`quantize_blend_weights`. For integer images the offset
+    image saturates at the pixel range, and with fixed-point weights the
+    offset is rounded to the nearest integer.
+    """
+    _blend_add(canvas, image, weights, x, y, offset)
+
+
+def quantize_blend_weights(weights: "NDArray[np.float32]") -> "NDArray[np.uint16]":
+    """Convert [0, 1] blending weights to the fixed-point format of ``blend_add``.
+
+    Weights become Q1.15 integers (1.0 maps exactly to ``1 << 15``). Integer
+    images blend about twice as fast with these: half the weight bandwidth
+    and no float conversions, at a rounding error below one gray level.
+    """
+    one = 1 << BLEND_WEIGHT_SHIFT
+    return np.clip(np.rint(weights * one), 0, one).astype(np.uint16)
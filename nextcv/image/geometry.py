@@ -7,3 +7,33 @@ Includes operations like:
 - Perspective warping and remapping
 - Flipping, cropping, and padding
 """
+
+from typing import TYPE_CHECKING, Tuple
+
+from nextcv._cpp.nextcv_py.image import remap_bilinear as _remap_bilinear
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+def remap_bilinear(
+    image: "NDArray[np.uint8] | NDArray[np.uint16]",
+    maps: Tuple["NDArray[np.int16]", "NDArray[np.uint16]"],
+) -> "NDArray[np.uint8] | NDArray[np.uint16]":
+    """Bilinearly remap a single-channel 8/16-bit image with fixed-point maps.
+
+    Specialised equivalent of ``cv2.remap(image, *maps, cv2.INTER_LINEAR,
+    borderMode=cv2.BORDER_REPLICATE)`` for maps from ``cv2.convertMaps(...,
+    cv2.CV_16SC2)``, about 1.5-2x faster. Results match OpenCV to within one
+    gray level (interpolation is rounded in integer arithmetic).
+
+    Args:
+        image: C-contiguous 2D uint8 or uint16 image
+        maps: (h, w, 2) int16 source coordinates and (h, w) uint16
+            sub-pixel indices
+
+    Returns:
+        Remapped (h, w) image of the input dtype
+    """
+    return _remap_bilinear(image, *maps)
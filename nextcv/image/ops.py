@@ -6,7 +6,7 @@ Includes operations like:
 - Thresholding and binarization
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from nextcv._cpp.nextcv_py.image import invert as _invert
 
@@ -15,6 +15,17 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
-def invert(image: "NDArray[np.uint8]") -> "NDArray[np.uint8]":
-    """Invert the image."""
-    return _invert(image)
+def invert(
+    image: "NDArray[np.uint8]", out: Optional["NDArray[np.uint8]"] = None
+) -> "NDArray[np.uint8]":
+    """Invert the image.
+
+    Args:
+        image: C-contiguous 8-bit image
+        out: Optional preallocated C-contiguous uint8 array with the shape of
+            ``image`` to write into (may be ``image`` itself for in-place use)
+
+    Returns:
+        Inverted image (``out`` when given)
+    """
+    return _invert(image, out)
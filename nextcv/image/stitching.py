@@ -3,17 +3,40 @@
 Simple, extensible architecture for stitching images from multiple cameras.
 """
 
+import os
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Generic, List, Optional, Tuple, TypeVar
+from functools import lru_cache
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
 
 import cv2
 import numpy as np
 
+from nextcv.image.compose import blend_add, quantize_blend_weights
+from nextcv.image.geometry import remap_bilinear
 from nextcv.sensors.camera import Camera, PinholeCamera
 
 CameraType = TypeVar("CameraType", bound=Camera)
 
+# Pixel types supported by the fused blend kernel
+_BLEND_ADD_DTYPES = {np.uint8, np.uint16, np.float32}
+
+# Pixel types supported by the specialised remap kernel (single channel)
+_REMAP_DTYPES = {np.uint8, np.uint16}
+
+
+@lru_cache(maxsize=None)
+def _warp_pool() -> ThreadPoolExecutor:
+    """Return the executor shared by all stitchers, created on first use."""
+    return ThreadPoolExecutor(os.cpu_count() or 1, thread_name_prefix="nextcv-warp")
+
+
+# A forked child inherits the executor but none of its threads
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_warp_pool.cache_clear)
+
 
 # ============================================================================
 # Rect and Tile Classes
@@ -64,13 +87,26 @@ class Rect:
         return Rect(x, y, w, h) if w > 0 and h > 0 else None
 
 
+def _local_overlap_slices(
+    rect_i: Rect, rect_j: Rect
+) -> Optional[Tuple[Tuple[slice, slice], Tuple[slice, slice]]]:
+    """Return the overlap of two rects as numpy slices local to each rect."""
+    overlap = rect_i.intersect(rect_j)
+    if overlap is None:
+        return None
+    return (
+        overlap.numpy_slices(rect_i.x, rect_i.y),
+        overlap.numpy_slices(rect_j.x, rect_j.y),
+    )
+
+
 @dataclass
 class Tile:
     """A tile within a canvas for image stitching."""
 
     rect: Rect
-    maps: Tuple[np.ndarray, np.ndarray]  # source -> tile transform
-    mask: np.ndarray  # (h,w) binary mask
+    maps: Tuple[np.ndarray, np.ndarray]  # source -> tile transform (cv2.remap maps)
+    mask: np.ndarray  # (h,w) boolean mask of valid pixels
     weights: np.ndarray  # (h,w) normalized blending weights
 
     def update_weights(self, weights: np.ndarray) -> "Tile":
@@ -78,8 +114,19 @@ class Tile:
         self.weights = weights
         return self
 
+    def remaps_natively(self, src_img: np.ndarray) -> bool:
+        """Whether warp_image takes the single-threaded C++ remap for src_img."""
+        return (
+            src_img.ndim == 2  # noqa: PLR2004
+            and src_img.dtype.type in _REMAP_DTYPES
+            and self.maps[0].dtype == np.int16
+            and src_img.flags["C_CONTIGUOUS"]
+        )
+
     def warp_image(self, src_img: np.ndarray) -> np.ndarray:
         """Warp source image to this tile."""
+        if self.remaps_natively(src_img):
+            return remap_bilinear(src_img, self.maps)
         return cv2.remap(
             src_img,
             self.maps[0],
@@ -96,33 +143,69 @@ class Tile:
         # Get remapping maps from camera to target
         mapx, mapy = canvas.maps_from(camera)
 
-        # Find bounding region in target coordinates using OpenCV
+        # Find bounding region in target coordinates
         # mapx, mapy are source coordinates for each target pixel
         valid_mask = (
             (mapx >= 0) & (mapx < camera.width) & (mapy >= 0) & (mapy < camera.height)
-        ).astype(np.uint8)
+        )
 
-        # Use OpenCV to find bounding rectangle of valid region
-        points = cv2.findNonZero(valid_mask)
-        if points is None:
+        # Bounding rectangle of the valid region from its row/column projections
+        # (O(H + W) after one reduction pass, no per-pixel coordinate list)
+        cols = valid_mask.any(axis=0)
+        rows = valid_mask.any(axis=1)
+        if not cols.any():
             return None
+        x0, x1 = int(cols.argmax()), cols.size - int(cols[::-1].argmax())
+        y0, y1 = int(rows.argmax()), rows.size - int(rows[::-1].argmax())
 
-        roi = Rect(*cv2.boundingRect(points)).clamp_to(*canvas.size)
+        roi = Rect(x0, y0, x1 - x0, y1 - y0).clamp_to(*canvas.size)
         if not roi:
             return None
 
-        # Extract maps for this region
-        y_slice, x_slice = roi.numpy_slices()
-        roi_mapx = mapx[y_slice, x_slice]
-        roi_mapy = mapy[y_slice, x_slice]
+        # Extract maps for this region and convert them once to OpenCV's
+        # fixed-point format (CV_16SC2 + CV_16UC1), which remap consumes directly
+        roi_maps = (mapx[roi.s], mapy[roi.s])
+        maps = cv2.convertMaps(*roi_maps, cv2.CV_16SC2)
 
         # Create mask for valid pixels in this region
-        mask = valid_mask[y_slice, x_slice].astype(np.uint8)
+        mask = np.ascontiguousarray(valid_mask[roi.s])
 
-        # Generate raw weights using distance transform
-        weights = cv2.distanceTransform(mask, cv2.DIST_L2, 3).astype(np.float32)
+        # Generate raw weights by feathering towards the source image border
+        weights = _feather_weights(*roi_maps, camera.size, mask)
 
-        return Tile(rect=roi, maps=(roi_mapx, roi_mapy), mask=mask, weights=weights)
+        return Tile(
+            rect=roi,
+            maps=maps,
+            mask=mask,
+            weights=weights,
+        )
+
+
+def _feather_weights(
+    mapx: np.ndarray, mapy: np.ndarray, size: Tuple[int, int], mask: np.ndarray
+) -> np.ndarray:
+    """Distance of each mapped pixel to the nearest source image border.
+
+    Read off the maps directly rather than distance-transforming the warped
+    mask: one elementwise pass, exact for rotated or sheared borders. Valid
+    pixels weigh at least 1 (as with a distance transform), invalid ones 0.
+    """
+    width, height = size
+    weights = np.minimum(mapx, (width - 1) - mapx, dtype=np.float32)
+    np.minimum(weights, mapy, out=weights)
+    np.minimum(weights, (height - 1) - mapy, out=weights)
+    np.maximum(weights, 0, out=weights)
+    weights += 1
+    weights *= mask
+    return weights
+
+
+def _overlaps_any(tile: Tile, tiles: List[Tile]) -> bool:
+    """Return True if the tile's rect intersects any other tile's rect."""
+    return any(
+        other is not tile and tile.rect.intersect(other.rect) is not None
+        for other in tiles
+    )
 
 
 # ============================================================================
@@ -151,6 +234,27 @@ class ExposureCompensator(ABC):
             List of corrected images
         """
 
+    def biases(  # noqa: PLR6301
+        self, tiles: List[Tile], warped_images: List[np.ndarray]
+    ) -> Optional[List[float]]:
+        """Compute per-image additive corrections without applying them.
+
+        Purely additive compensators override this so the stitcher can fold
+        the corrections into the blend instead of materializing corrected
+        images. The stitcher only does so while ``__call__`` is the built-in
+        NoOpCompensator or AdditiveCompensator one, so a subclass overriding
+        ``__call__`` is always called. The default (None) also makes the
+        stitcher call the compensator.
+
+        Args:
+            tiles: List of tiles with rect, mask, and weights
+            warped_images: List of warped images (one per tile)
+
+        Returns:
+            Bias to add to each image, or None if not purely additive
+        """
+        return None
+
 
 class NoOpCompensator(ExposureCompensator):
     """No compensation - returns images unchanged.
@@ -165,6 +269,52 @@ class NoOpCompensator(ExposureCompensator):
         """Return images unchanged."""
         return warped_images
 
+    def biases(  # noqa: PLR6301
+        self, tiles: List[Tile], warped_images: List[np.ndarray]
+    ) -> List[float]:
+        """Return a zero bias for every image."""
+        return [0.0] * len(warped_images)
+
+
+def _median(values: np.ndarray) -> float:
+    """Exact median of a 1D array, using a histogram for 8/16-bit unsigned data.
+
+    Counting pixel values is a single linear pass, which is much cheaper than
+    the partition ``np.median`` performs on large overlaps. Falls back to
+    ``np.median`` for other dtypes, or when the histogram would have more bins
+    than there are values.
+    """
+    if values.dtype.type not in {np.uint8, np.uint16} or values.max() >= values.size:
+        return float(np.median(values))
+    cdf = np.cumsum(np.bincount(values))
+    n = values.size
+    # Average the two middle order statistics (equal when n is odd)
+    lower = np.searchsorted(cdf, (n + 1) // 2)
+    upper = np.searchsorted(cdf, n // 2 + 1)
+    return (int(lower) + int(upper)) / 2
+
+
+@dataclass
+class _OverlapEntry:
+    """Cached jointly valid pixels of a tile pair, with the state they came from."""
+
+    refs: Tuple["weakref.ref[Tile]", "weakref.ref[Tile]"]
+    state: Tuple[Rect, np.ndarray, Rect, np.ndarray]
+    pixels: Optional[Tuple[np.ndarray, np.ndarray]]
+
+    def matches(self, tile_i: Tile, tile_j: Tile) -> bool:
+        """Return True if the entry is still valid for this tile pair."""
+        rect_i, mask_i, rect_j, mask_j = self.state
+        # ids are reused once tiles are freed, so check identity too
+        return (
+            self.refs[0]() is tile_i
+            and self.refs[1]() is tile_j
+            and tile_i.rect == rect_i
+            and tile_j.rect == rect_j
+            and tile_i.mask is mask_i
+            and tile_j.mask is mask_j
+        )
+
 
 class AdditiveCompensator(ExposureCompensator):
     """Sequential additive bias correction.
@@ -176,23 +326,98 @@ class AdditiveCompensator(ExposureCompensator):
     Good for small-to-medium brightness differences in thermal cameras.
     """
 
+    def __init__(self) -> None:
+        """Create an additive compensator."""
+        # Jointly valid overlap pixels per (tile_i, tile_j) pair. They depend on
+        # tile geometry only, so they are located once instead of every frame.
+        # Tiles are held weakly: an entry is dropped once either tile is gone
+        self._overlap_cache: Dict[Tuple[int, int], _OverlapEntry] = {}
+
+    def __getstate__(self) -> dict:
+        """Drop the overlap cache (weak references) when pickling or copying."""
+        state = self.__dict__.copy()
+        state["_overlap_cache"] = {}
+        return state
+
     def __call__(self, tiles: List[Tile], images: List[np.ndarray]) -> List[np.ndarray]:
         """Compute and apply additive bias corrections."""
-        corrected_images = [images[0]] * len(images)  # use first image as reference
+        biases = self.biases(tiles, images)
+        # Unbiased images (always the reference) are returned as-is, not copied
+        return [img + bias if bias else img for img, bias in zip(images, biases)]
 
+    def biases(self, tiles: List[Tile], images: List[np.ndarray]) -> List[float]:
+        """Compute the additive bias of each image, the first one being zero."""
+        biases = [0.0] * len(images)
         for i in range(1, len(images)):
-            # Compute bias relative to corrected previous image
-            bias = self._compute_bias_between_tiles(
-                tiles[i - 1],
-                tiles[i],
-                corrected_images[i - 1],
+            # The median shifts with the bias, so the bias relative to the
+            # corrected previous image is its bias plus the raw difference
+            biases[i] = biases[i - 1] + self._bias_from_pixels(
+                self._cached_joint_valid_pixels(tiles[i - 1], tiles[i]),
+                images[i - 1],
                 images[i],
             )
+        return biases
 
-            # Apply correction
-            corrected_images[i] = images[i] + bias
+    def _cached_joint_valid_pixels(
+        self, tile_i: Tile, tile_j: Tile
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return ``_joint_valid_pixels`` for a tile pair, computed once per pair.
 
-        return corrected_images
+        The result is recomputed when a tile's rect or mask is replaced;
+        in-place edits of a mask are not detected.
+        """
+        key = (id(tile_i), id(tile_j))
+        cached = self._overlap_cache.get(key)
+        if cached is None or not cached.matches(tile_i, tile_j):
+            cache = self._overlap_cache
+
+            def evict(ref: "weakref.ref[Tile]") -> None:
+                entry = cache.get(key)
+                if entry is not None and ref in entry.refs:
+                    del cache[key]
+
+            cached = _OverlapEntry(
+                refs=(weakref.ref(tile_i, evict), weakref.ref(tile_j, evict)),
+                state=(tile_i.rect, tile_i.mask, tile_j.rect, tile_j.mask),
+                pixels=self._joint_valid_pixels(tile_i, tile_j),
+            )
+            cache[key] = cached
+        return cached.pixels
+
+    @staticmethod
+    def _joint_valid_pixels(
+        tile_i: Tile, tile_j: Tile
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Locate the overlap pixels valid in both tiles.
+
+        Returns:
+            Flat indices of those pixels into each tile's image, or None if the
+            tiles share no valid pixel
+        """
+        # Overlap in LOCAL tile coordinates
+        overlap = _local_overlap_slices(tile_i.rect, tile_j.rect)
+        if overlap is None:
+            return None
+        (ys_i, xs_i), (ys_j, xs_j) = overlap
+
+        ys, xs = np.nonzero(tile_i.mask[ys_i, xs_i] & tile_j.mask[ys_j, xs_j])
+        if ys.size == 0:
+            return None
+        flat_i = (ys + ys_i.start) * tile_i.rect.w + (xs + xs_i.start)
+        flat_j = (ys + ys_j.start) * tile_j.rect.w + (xs + xs_j.start)
+        return flat_i, flat_j
+
+    @staticmethod
+    def _bias_from_pixels(
+        pixels: Optional[Tuple[np.ndarray, np.ndarray]],
+        img_i: np.ndarray,
+        img_j: np.ndarray,
+    ) -> float:
+        """Return the bias (difference in medians) over the given pixels."""
+        if pixels is None:
+            return 0.0
+        flat_i, flat_j = pixels
+        return float(_median(np.take(img_i, flat_i)) - _median(np.take(img_j, flat_j)))
 
     @staticmethod
     def _compute_bias_between_tiles(
@@ -212,43 +437,24 @@ class AdditiveCompensator(ExposureCompensator):
         Returns:
             Bias to add to img_j to match img_i (float scalar)
         """
-        # 1. Compute overlap in canvas space
-        overlap_canvas = tile_i.rect.intersect(tile_j.rect)
-        if overlap_canvas is None:
-            return 0.0
+        pixels = AdditiveCompensator._joint_valid_pixels(tile_i, tile_j)
+        return AdditiveCompensator._bias_from_pixels(pixels, img_i, img_j)
 
-        # 2. Convert to LOCAL tile coordinates for extraction
-        overlap_in_i = Rect(
-            x=overlap_canvas.x - tile_i.rect.x,
-            y=overlap_canvas.y - tile_i.rect.y,
-            w=overlap_canvas.w,
-            h=overlap_canvas.h,
-        )
-        overlap_in_j = Rect(
-            x=overlap_canvas.x - tile_j.rect.x,
-            y=overlap_canvas.y - tile_j.rect.y,
-            w=overlap_canvas.w,
-            h=overlap_canvas.h,
-        )
 
-        # 3. Extract overlap regions from warped tile images
-        overlap_i = img_i[overlap_in_i.s]
-        overlap_j = img_j[overlap_in_j.s]
+def _additive_biases(
+    compensator: ExposureCompensator, tiles: List[Tile], images: List[np.ndarray]
+) -> Optional[List[float]]:
+    """Return the compensator's biases if applying them is all it does, else None.
 
-        # 4. Apply masks to get valid pixels only
-        mask_i = tile_i.mask[overlap_in_i.s] > 0
-        mask_j = tile_j.mask[overlap_in_j.s] > 0
-        mask_both = mask_i & mask_j
-
-        if not np.any(mask_both):
-            return 0.0
-
-        # 5. Compute bias (difference in medians)
-        median_i = np.median(overlap_i[mask_both])
-        median_j = np.median(overlap_j[mask_both])
-        bias = median_i - median_j
-
-        return float(bias)
+    Only the built-in ``__call__`` implementations are known to just add the
+    biases; a subclass overriding ``__call__`` must be called instead.
+    """
+    if type(compensator).__call__ not in {
+        NoOpCompensator.__call__,
+        AdditiveCompensator.__call__,
+    }:
+        return None
+    return compensator.biases(tiles, images)
 
 
 # ============================================================================
@@ -256,6 +462,16 @@ class AdditiveCompensator(ExposureCompensator):
 # ============================================================================
 
 
+@dataclass
+class _TileBlend:
+    """Blend data derived from a tile's weights, with the arrays it came from."""
+
+    weights: np.ndarray
+    mask: np.ndarray
+    weights_q15: np.ndarray  # fixed-point copy for blending integer images
+    is_mask: bool  # weights are one on the mask and zero elsewhere
+
+
 class ImageStitcher(ABC, Generic[CameraType]):
     """Abstract base class for image stitching."""
 
@@ -278,6 +494,9 @@ class ImageStitcher(ABC, Generic[CameraType]):
         self.tiles = self.create_warp_tiles(cameras, self.virtual_camera)
         self.compensator = compensator or NoOpCompensator()
 
+        # Blend data per tile index, derived from the current tile weights
+        self._tile_blends: Dict[int, _TileBlend] = {}
+
     @abstractmethod
     def _create_virtual_cam(self) -> CameraType:
         """Create virtual camera defining output coordinate system."""
@@ -293,18 +512,23 @@ class ImageStitcher(ABC, Generic[CameraType]):
         weight_sum = np.zeros((canvas.height, canvas.width), np.float32)
         for tile in tiles:
             weight_sum[tile.rect.s] += tile.weights
-        weight_sum = np.clip(weight_sum, 1e-6, None)  # Avoid division by zero
+        np.maximum(weight_sum, 1e-6, out=weight_sum)  # Avoid division by zero
 
-        # Normalize weights for each tile (also called feather weights)
-        tiles = [
-            tile.update_weights(tile.weights / weight_sum[tile.rect.s])
-            for tile in tiles
-        ]
+        # Normalize weights for each tile (also called feather weights), in place
+        # so each stays one C-contiguous float32 block for the blend. A tile
+        # that overlaps no other tile has weight one wherever it is valid
+        for tile in tiles:
+            if _overlaps_any(tile, tiles):
+                np.divide(tile.weights, weight_sum[tile.rect.s], out=tile.weights)
+            else:
+                np.copyto(tile.weights, tile.mask)
 
         return tiles
 
-    def _sanity_checks(self, images: List[np.ndarray]) -> None:
-        """Sanity checks for the images."""
+    def _sanity_checks(
+        self, images: List[np.ndarray], out: Optional[np.ndarray] = None
+    ) -> None:
+        """Sanity checks for the images and the optional output buffer."""
         if len(images) != len(self.cameras):
             raise ValueError(f"Expected {len(self.cameras)} images, got {len(images)}")
 
@@ -312,32 +536,144 @@ class ImageStitcher(ABC, Generic[CameraType]):
         if not all(img.dtype == images[0].dtype for img in images):
             raise ValueError("All images must have the same dtype")
 
-    def stitch(self, images: List[np.ndarray]) -> np.ndarray:
-        """Stitch images into the virtual camera."""
-        self._sanity_checks(images)
+        shape = self.virtual_camera.size[::-1]
+        if out is not None and (
+            out.shape != shape
+            or out.dtype != images[0].dtype
+            or not out.flags["C_CONTIGUOUS"]
+        ):
+            raise ValueError(
+                f"out must be a C-contiguous {images[0].dtype} array of shape {shape}"
+            )
 
-        stitched = np.zeros(self.virtual_camera.size[::-1], dtype=images[0].dtype)
-        if not self.tiles:
-            return stitched
+    def _warp_images(self, images: List[np.ndarray]) -> List[np.ndarray]:
+        """Warp images to virtual camera space, kept in the input dtype.
+
+        Tiles are warped concurrently on the shared pool only when every one
+        takes the C++ remap, which is single-threaded and releases the GIL;
+        cv2.remap already spreads over OpenCV's own threads.
+        """
+        concurrent = (
+            len(self.tiles) > 1
+            and (os.cpu_count() or 1) > 1
+            and all(map(Tile.remaps_natively, self.tiles, images))
+        )
+        if not concurrent:
+            return [tile.warp_image(img) for img, tile in zip(images, self.tiles)]
+        return list(_warp_pool().map(Tile.warp_image, self.tiles, images))
+
+    def _tile_blend(self, i: int) -> _TileBlend:
+        """Return the blend data of tile i, recomputed once its arrays change.
+
+        Replaced tiles or arrays (e.g. ``Tile.update_weights``) are picked up;
+        in-place edits of the weights or mask are not detected.
+        """
+        tile = self.tiles[i]
+        entry = self._tile_blends.get(i)
+        if (
+            entry is None
+            or entry.weights is not tile.weights
+            or entry.mask is not tile.mask
+        ):
+            entry = _TileBlend(
+                tile.weights,
+                tile.mask,
+                quantize_blend_weights(tile.weights),
+                bool(np.array_equal(tile.weights, tile.mask)),
+            )
+            self._tile_blends[i] = entry
+        return entry
+
+    def _is_exclusive(self, i: int) -> bool:
+        """Whether tile i is written by masking: no other tile blends into it."""
+        tile = self.tiles[i]
+        return self._tile_blend(i).is_mask and not _overlaps_any(tile, self.tiles)
+
+    def _blend_tile(
+        self, stitched: np.ndarray, i: int, corrected: np.ndarray, bias: float
+    ) -> None:
+        """Accumulate ``(corrected + bias) * weights`` of tile i into stitched.
+
+        Unbiased exclusive tiles just write their valid pixels; same-dtype,
+        C-contiguous images take the fused C++ kernel (fixed-point weights
+        for integer pixels, float32 weights otherwise); the rest (e.g.
+        float64 or strided views) are weighted in their promoted dtype and
+        accumulated in place.
+        """
+        tile = self.tiles[i]
+        canvas = stitched[tile.rect.s]
+        integer_canvas = stitched.dtype.kind == "u"
+        weights = self._tile_blend(i).weights_q15 if integer_canvas else tile.weights
+        if bias == 0.0 and self._is_exclusive(i):
+            np.multiply(corrected, tile.mask, out=canvas, casting="unsafe")
+        elif (
+            corrected.dtype == stitched.dtype
+            and stitched.dtype.type in _BLEND_ADD_DTYPES
+            and corrected.flags["C_CONTIGUOUS"]
+            and weights.dtype == (np.uint16 if integer_canvas else np.float32)
+            and weights.flags["C_CONTIGUOUS"]
+        ):
+            blend_add(stitched, corrected, weights, tile.rect.x, tile.rect.y, bias)
+        else:
+            # Weighted in the promoted dtype, e.g. float64 stays float64
+            weighted = corrected * tile.weights
+            if bias != 0.0:
+                # (corrected + bias) * w, distributed over the weights
+                weighted += np.multiply(tile.weights, bias, dtype=weighted.dtype)
+            np.add(canvas, weighted, out=canvas, casting="unsafe")
+
+    def stitch(
+        self, images: List[np.ndarray], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Stitch images into the virtual camera.
 
-        # 1. Warp images to virtual camera space
-        warped_images = [
-            tile.warp_image(img).astype(np.float32)
-            for img, tile in zip(images, self.tiles)
-        ]
+        Args:
+            images: One image per camera, all of the same dtype
+            out: Optional preallocated C-contiguous output with the virtual
+                camera's shape and the images' dtype, reused across frames to
+                skip allocating and zeroing a new canvas. Only pixels inside
+                tile rects are written; the rest are left untouched
+
+        Returns:
+            Stitched image (``out`` when given)
+        """
+        self._sanity_checks(images, out)
 
-        # 2. Apply exposure compensation
-        corrected_images = self.compensator(self.tiles, warped_images)
+        if out is None:
+            stitched = np.zeros(self.virtual_camera.size[::-1], dtype=images[0].dtype)
+        else:
+            stitched = out
+        if not self.tiles:
+            return stitched
 
-        # 3. Blend corrected images into stitched result
-        for corrected, tile in zip(corrected_images, self.tiles):
-            stitched[tile.rect.s] += (corrected * tile.weights).astype(stitched.dtype)
+        # 1. Warp images to virtual camera space (kept in the input dtype)
+        warped_images = self._warp_images(images)
+
+        # 2. Exposure compensation. Additive corrections are folded into the
+        #    blend below rather than applied to full corrected images
+        biases = _additive_biases(self.compensator, self.tiles, warped_images)
+        if biases is None:
+            corrected_images = self.compensator(self.tiles, warped_images)
+            biases = [0.0] * len(corrected_images)
+        else:
+            corrected_images = warped_images
+
+        # 3. Blend (corrected + bias) into stitched result
+        if out is not None:
+            # A reused canvas only needs clearing where tiles accumulate
+            for i, tile in enumerate(self.tiles):
+                if not (biases[i] == 0.0 and self._is_exclusive(i)):
+                    stitched[tile.rect.s] = 0
+        for i, (corrected, bias) in enumerate(zip(corrected_images, biases)):
+            self._blend_tile(stitched, i, corrected, bias)
 
         return stitched
 
-    def __call__(self, images: List[np.ndarray]) -> np.ndarray:
+    def __call__(
+        self, images: List[np.ndarray], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Stitch images into panorama."""
-        return self.stitch(images)
+        return self.stitch(images, out)
 
 
 class HorizontalStitcher(ImageStitcher[PinholeCamera]):
@@ -349,27 +685,27 @@ class HorizontalStitcher(ImageStitcher[PinholeCamera]):
         for cam in self.cameras[1:]:
             virtual_cam = PinholeCamera.hconcat(virtual_cam, cam)
 
-        # Find bounding rectangle that contains all cameras
-        all_corners = [
-            cv2.perspectiveTransform(
-                np.array(
-                    [
-                        [
-                            [0, 0],
-                            [cam.width, 0],
-                            [cam.width, cam.height],
-                            [0, cam.height],
-                        ]
-                    ],
-                    dtype=np.float32,
-                ),
-                cam.compute_homography_to(virtual_cam),
-            )[0]  # Remove batch dimension for each camera
-            for cam in self.cameras
-        ]
-        all_corners = np.vstack(all_corners)
-        x_min, y_min = all_corners.min(axis=0)
-        x_max, y_max = all_corners.max(axis=0)
+        # Find bounding rectangle that contains all cameras: project every
+        # camera's homogeneous corners with its homography in one batch
+        homographies = np.stack(
+            [cam.compute_homography_to(virtual_cam) for cam in self.cameras]
+        )
+        corners = np.array(
+            [
+                [
+                    [0, 0, 1],
+                    [cam.width, 0, 1],
+                    [cam.width, cam.height, 1],
+                    [0, cam.height, 1],
+                ]
+                for cam in self.cameras
+            ],
+            dtype=np.float64,
+        )
+        projected = np.einsum("nij,nkj->nki", homographies, corners)
+        all_corners = (projected[..., :2] / projected[..., 2:]).reshape(-1, 2)
+        x_min, y_min = all_corners.min(axis=0).tolist()
+        x_max, y_max = all_corners.max(axis=0).tolist()
 
         # Compute margins needed to fit all corners
         left = max(0, -x_min)
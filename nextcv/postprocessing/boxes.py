@@ -3,7 +3,6 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
-from ensemble_boxes import weighted_boxes_fusion
 
 from nextcv._cpp.nextcv_py.postprocessing import nms as _nms
 from nextcv._cpp.nextcv_py.postprocessing import wbf as _wbf
@@ -91,6 +90,9 @@ def wbf_np(
     **kwargs: object,
 ) -> tuple["NDArray[np.float32]", "NDArray[np.float32]", "NDArray[np.int32]"]:
     """Reference WBF implementation from `ensemble_boxes` package."""
+    # Imported on use: ensemble_boxes pulls in pandas, which dominates import time
+    from ensemble_boxes import weighted_boxes_fusion
+
     weights = kwargs.get("weights")
     iou_thr = float(kwargs.get("iou_thr", 0.55))
     skip_box_thr = float(kwargs.get("skip_box_thr", 0.0))
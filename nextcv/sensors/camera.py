@@ -205,32 +205,32 @@ class PinholeCamera(Camera):
             K_source = self.K @ np.diag([-1.0, -1.0, 1.0])
             K_target = target.K @ np.diag([-1.0, -1.0, 1.0])
 
-        # Compute the homography matrix
-        H = K_target @ np.linalg.inv(R_target) @ R_source @ np.linalg.inv(K_source)
+        # Compute the homography matrix (rotations are inverted by transposing)
+        H = K_target @ R_target.T @ R_source @ np.linalg.inv(K_source)
         return H
 
     def maps_from(
         self, src: "PinholeCamera", neg_focal_length: bool = True
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Create remapping maps from source camera to this camera."""
-        # src -> self homography (3x3)
-        H = src.compute_homography_to(self, neg_focal_length).astype(np.float32)
-        Hinv = np.linalg.inv(H).astype(np.float32)  # we need dst(self)->src map
-
-        # Meshgrid of target pixel centers (x right, y down)
-        xs, ys = np.meshgrid(
-            np.arange(self.width, dtype=np.float32),
-            np.arange(self.height, dtype=np.float32),
-            indexing="xy",
-        )
-
-        # Homogeneous coords in target → map back into source
-        ones = np.ones_like(xs, dtype=np.float32)
-        dst_h = np.stack((xs, ys, ones), axis=-1)  # (H,W,3)
-        src_h = dst_h @ Hinv.T  # (H,W,3)
-        src_h[..., 2] = np.clip(src_h[..., 2], 1e-8, None)
-
-        uv = src_h[..., :2] / src_h[..., 2:3]  # (H,W,2)
-        mapx = np.ascontiguousarray(uv[..., 0], dtype=np.float32)
-        mapy = np.ascontiguousarray(uv[..., 1], dtype=np.float32)
+        # We need the dst(self) -> src map, i.e. the inverse of the src -> self
+        # homography. Build it directly in float64 instead of inverting
+        Hinv = self.compute_homography_to(src, neg_focal_length).astype(np.float32)
+
+        # Target pixel centers (x right, y down) as a row and a column vector
+        xs = np.arange(self.width, dtype=np.float32)
+        ys = np.arange(self.height, dtype=np.float32)[:, None]
+
+        # Map homogeneous target coords back into source. Each row of Hinv is
+        # applied separably, so broadcasting builds every (H,W) plane directly
+        # without a meshgrid or an (H,W,3) stack
+        def project(row: np.ndarray) -> np.ndarray:
+            return row[0] * xs + (row[1] * ys + row[2])
+
+        w = project(Hinv[2])
+        np.maximum(w, 1e-8, out=w)
+        mapx = project(Hinv[0])
+        mapx /= w
+        mapy = project(Hinv[1])
+        mapy /= w
         return mapx, mapy
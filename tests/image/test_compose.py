@@ -0,0 +1,68 @@
+"""Test image composition."""
+
+import numpy as np
+import pytest
+
+import nextcv.image as cvi
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+def test_blend_add_matches_numpy(dtype: type):
+    """Test that the fused blend matches the NumPy multiply-add reference."""
+    rng = np.random.default_rng(42)
+    canvas = rng.integers(0, 50, (6, 8)).astype(dtype)
+    image = rng.integers(0, 200, (3, 4)).astype(dtype)
+    weights = rng.random((3, 4), dtype=np.float32)
+
+    expected = canvas.copy()
+    region = expected[2:5, 1:5]
+    np.add(region, image * weights, out=region, casting="unsafe")
+
+    cvi.blend_add(canvas, image, weights, x=1, y=2)
+    np.testing.assert_array_equal(canvas, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_blend_add_fixed_point_weights(dtype: type):
+    """Test that Q1.15 weights round to nearest and keep full weight exact."""
+    rng = np.random.default_rng(42)
+    image = rng.integers(0, np.iinfo(dtype).max, (3, 4)).astype(dtype)
+    weights = rng.random((3, 4), dtype=np.float32)
+    weights[0] = 1.0
+
+    canvas = np.zeros((3, 4), dtype=dtype)
+    cvi.blend_add(canvas, image, cvi.quantize_blend_weights(weights), x=0, y=0)
+
+    np.testing.assert_array_equal(canvas[0], image[0])
+    np.testing.assert_allclose(canvas, np.rint(image * weights), atol=1)
+
+
+@pytest.mark.parametrize("quantized", [False, True])
+def test_blend_add_offset(quantized: bool):
+    """Test that the offset is added to the image, saturating, before weighting."""
+    image = np.array([[10, 100, 250]], dtype=np.uint8)
+    weights = np.full((1, 3), 0.5, np.float32)
+    if quantized:
+        weights = cvi.quantize_blend_weights(weights)
+
+    canvas = np.zeros((1, 3), dtype=np.uint8)
+    cvi.blend_add(canvas, image, weights, x=0, y=0, offset=-20.0)
+    np.testing.assert_array_equal(canvas, [[0, 40, 115]])
+
+
+def test_blend_add_saturates():
+    """Test that integer results are clamped instead of wrapping around."""
+    canvas = np.full((2, 2), 250, dtype=np.uint8)
+    image = np.full((2, 2), 200, dtype=np.uint8)
+
+    cvi.blend_add(canvas, image, np.ones((2, 2), np.float32), x=0, y=0)
+    np.testing.assert_array_equal(canvas, 255)
+
+
+def test_blend_add_rejects_out_of_bounds_region():
+    """Test that a region extending past the canvas raises an error."""
+    canvas = np.zeros((4, 4), dtype=np.uint8)
+    image = np.zeros((2, 2), dtype=np.uint8)
+
+    with pytest.raises(ValueError, match="does not fit"):
+        cvi.blend_add(canvas, image, np.ones((2, 2), np.float32), x=3, y=0)
@@ -0,0 +1,39 @@
+"""Test geometric image transformations."""
+
+import cv2
+import numpy as np
+import pytest
+
+import nextcv.image as cvi
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_remap_bilinear_matches_opencv(dtype: type):
+    """Test that the specialised remap matches cv2.remap, borders included."""
+    rng = np.random.default_rng(42)
+    image = rng.integers(0, np.iinfo(dtype).max, (24, 32)).astype(dtype)
+
+    # Rotated, scaled sampling grid that runs past every image border
+    ys, xs = np.mgrid[0:40, 0:50].astype(np.float32)
+    mapx = 0.8 * xs - 0.3 * ys - 4.5
+    mapy = 0.3 * xs + 0.8 * ys - 6.25
+    maps = cv2.convertMaps(mapx, mapy, cv2.CV_16SC2)
+
+    expected = cv2.remap(
+        image, *maps, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE
+    )
+    result = cvi.remap_bilinear(image, maps)
+
+    assert result.dtype == image.dtype
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, atol=1)
+
+
+def test_remap_bilinear_rejects_mismatched_maps():
+    """Test that maps of different shapes raise an error."""
+    image = np.zeros((4, 4), dtype=np.uint8)
+    xy = np.zeros((3, 3, 2), dtype=np.int16)
+    fractions = np.zeros((3, 2), dtype=np.uint16)
+
+    with pytest.raises(ValueError, match="maps must be"):
+        cvi.remap_bilinear(image, (xy, fractions))
@@ -43,3 +43,19 @@ def test_invert_preserves_shape():
 
     assert result.shape == input_array.shape
     assert result.dtype == input_array.dtype
+
+
+def test_invert_into_out():
+    """Test that inversion writes into a preallocated or aliased output."""
+    image = np.array([[0, 128], [255, 64]], dtype=np.uint8)
+    expected = np.array([[255, 127], [0, 191]], dtype=np.uint8)
+
+    out = np.empty_like(image)
+    assert cvi.invert(image, out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+    cvi.invert(image, out=image)  # in place
+    np.testing.assert_array_equal(image, expected)
+
+    with pytest.raises(ValueError, match="same shape"):
+        cvi.invert(image, out=np.empty(4, dtype=np.uint8))
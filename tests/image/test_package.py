@@ -0,0 +1,24 @@
+"""Test the nextcv.image package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["nextcv.image.stitching.HorizontalStitcher", "nextcv.image.LeftRightStitcher"],
+)
+def test_lazy_attributes_resolve(expression: str):
+    """Test that lazily imported names resolve as plain attributes."""
+    # A fresh interpreter, so no earlier test has imported the submodule yet
+    code = f"import nextcv.image; {expression}"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_dir_lists_lazy_attributes():
+    """Test that lazily imported names show up in dir()."""
+    import nextcv.image
+
+    assert {"stitching", "LeftRightStitcher"} <= set(dir(nextcv.image))
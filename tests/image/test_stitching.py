@@ -1,12 +1,25 @@
 """Tests for image stitching functionality."""
 
+import copy
+import gc
+import multiprocessing
+import os
+import pickle
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import numpy as np
 import pytest
 
 from nextcv.image.stitching import (
     AdditiveCompensator,
+    ExposureCompensator,
+    HorizontalStitcher,
     LeftRightStitcher,
     NoOpCompensator,
+    Rect,
+    Tile,
 )
 from nextcv.sensors import PinholeCamera
 
@@ -49,6 +62,20 @@ class TestLeftRightStitcher:
         assert stitcher.virtual_camera.width > 0
         assert stitcher.virtual_camera.height > 0
 
+    def test_tile_weights_are_normalized(self, stitcher: LeftRightStitcher):
+        """Test that tile weights are contiguous float32 and sum to one."""
+        weight_sum = np.zeros(stitcher.virtual_camera.size[::-1], np.float32)
+        for tile in stitcher.tiles:
+            assert tile.weights.dtype == np.float32
+            assert tile.weights.flags["C_CONTIGUOUS"]
+            weight_sum[tile.rect.s] += tile.weights
+        np.testing.assert_allclose(weight_sum, 1.0, rtol=1e-5)
+
+    def test_tile_weights_follow_mask(self, stitcher: LeftRightStitcher):
+        """Test that weights are positive exactly where the tile is valid."""
+        for tile in stitcher.tiles:
+            np.testing.assert_array_equal(tile.weights > 0, tile.mask)
+
     def test_stitching_no_op_comepnsator(self, stitcher: LeftRightStitcher):
         """Test that stitched values lie between input values (as requested by user)."""
         # Create left image with constant intensity
@@ -90,3 +117,296 @@ class TestLeftRightStitcher:
         # The key test: stitched values should match reference within relative tolerance
         assert abs(float(stitched.min()) - 16000) / 16000 <= 1e-3
         assert abs(float(stitched.max()) - 16000) / 16000 <= 1e-3
+
+    @pytest.mark.parametrize("base", [NoOpCompensator, AdditiveCompensator])
+    def test_stitching_calls_overridden_compensator(
+        self, stitcher: LeftRightStitcher, base: type
+    ):
+        """Test that subclasses overriding __call__ are not bypassed by biases()."""
+
+        class Constant(base):
+            def __call__(
+                self, tiles: List[Tile], images: List[np.ndarray]
+            ) -> List[np.ndarray]:
+                return [np.full_like(image, 5) for image in images]
+
+        stitcher.compensator = Constant()
+        images = [np.full((512, 640), value, np.uint16) for value in (1000, 3000)]
+        stitched = stitcher(images)
+        stitcher.compensator = NoOpCompensator()  # reset
+
+        covered = np.zeros(stitched.shape, dtype=bool)
+        for tile in stitcher.tiles:
+            covered[tile.rect.s] |= tile.mask
+        np.testing.assert_allclose(stitched[covered], 5, atol=1)
+
+    @pytest.mark.parametrize("compensator", [NoOpCompensator, AdditiveCompensator])
+    def test_concurrent_warping(
+        self,
+        stitcher: LeftRightStitcher,
+        compensator: type,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that warping on the shared pool matches the serial path and pickles."""
+        stitcher.compensator = compensator()
+        rng = np.random.default_rng(0)
+        images = [rng.integers(0, 2**16, (512, 640), dtype=np.uint16) for _ in range(2)]
+        serial = stitcher(images)
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        np.testing.assert_array_equal(stitcher(images), serial)
+        for clone in (pickle.loads(pickle.dumps(stitcher)), copy.deepcopy(stitcher)):
+            np.testing.assert_array_equal(clone(images), serial)
+        stitcher.compensator = NoOpCompensator()  # reset
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+    )
+    def test_concurrent_warping_after_fork(
+        self, stitcher: LeftRightStitcher, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a forked child does not wait on the parent's warp threads."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        images = [np.full((512, 640), 1000, np.uint16) for _ in range(2)]
+        expected = stitcher(images)  # starts the shared pool in the parent
+
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            stitched = pool.apply_async(stitcher, (images,)).get(timeout=20)
+        np.testing.assert_array_equal(stitched, expected)
+
+    def test_stitching_keeps_float64_precision(self, stitcher: LeftRightStitcher):
+        """Test that dtypes without a fused kernel blend in their own precision."""
+        rng = np.random.default_rng(0)
+        images = [1e9 + rng.random((512, 640)) for _ in range(2)]
+
+        expected = np.zeros(stitcher.virtual_camera.size[::-1])
+        for image, tile in zip(images, stitcher.tiles):
+            expected[tile.rect.s] += tile.warp_image(image) * tile.weights
+        np.testing.assert_array_equal(stitcher(images), expected)
+
+    def test_stitching_non_contiguous_corrected_images(
+        self, stitcher: LeftRightStitcher
+    ):
+        """Test that strided compensator outputs fall back to the NumPy blend."""
+
+        class Mirror(NoOpCompensator):
+            def __call__(
+                self, tiles: List[Tile], images: List[np.ndarray]
+            ) -> List[np.ndarray]:
+                return [image[:, ::-1] for image in images]
+
+        rng = np.random.default_rng(0)
+        images = [rng.random((512, 640), dtype=np.float32) for _ in range(2)]
+        expected = np.zeros(stitcher.virtual_camera.size[::-1], np.float32)
+        for image, tile in zip(images, stitcher.tiles):
+            expected[tile.rect.s] += tile.warp_image(image)[:, ::-1] * tile.weights
+        stitcher.compensator = Mirror()
+        stitched = stitcher(images)
+        stitcher.compensator = NoOpCompensator()  # reset
+        np.testing.assert_allclose(stitched, expected, rtol=1e-6)
+
+    def test_stitching_float64_tile_weights(self, stitcher: LeftRightStitcher):
+        """Test that weights updated to another dtype fall back to the NumPy blend."""
+        rng = np.random.default_rng(0)
+        images = [rng.random((512, 640), dtype=np.float32) for _ in range(2)]
+        expected = stitcher(images)
+        for tile in stitcher.tiles:
+            tile.update_weights(tile.weights.astype(np.float64))
+        np.testing.assert_allclose(stitcher(images), expected, rtol=1e-6)
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+    def test_stitching_follows_updated_weights(
+        self, stitcher: LeftRightStitcher, dtype: type
+    ):
+        """Test that weights updated after construction are used for every dtype."""
+        images = [np.full((512, 640), 200, dtype) for _ in range(2)]
+        before = stitcher(images).astype(np.float32)
+        for tile in stitcher.tiles:
+            tile.update_weights(tile.weights / 2)
+        np.testing.assert_allclose(stitcher(images), before / 2, atol=1)
+
+    def test_concurrent_stitching(self, stitcher: LeftRightStitcher):
+        """Test that threads sharing one stitcher get the serial results."""
+        rng = np.random.default_rng(0)
+        frames = [[rng.random((512, 640)) for _ in range(2)] for _ in range(4)]
+        expected = [stitcher(images) for images in frames]
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(stitcher, frames * 4))
+        for result, reference in zip(results, expected * 4):
+            np.testing.assert_array_equal(result, reference)
+
+    def test_stitching_into_reused_output(self, stitcher: LeftRightStitcher):
+        """Test that stitching into a dirty reused buffer matches a fresh result."""
+        rng = np.random.default_rng(0)
+        images = [rng.integers(0, 4096, (512, 640), dtype=np.uint16) for _ in range(2)]
+        expected = stitcher(images)
+
+        out = np.full_like(expected, 1234)
+        out[expected == 0] = 0  # pixels outside every tile are left untouched
+        assert stitcher(images, out=out) is out
+        np.testing.assert_array_equal(out, expected)
+
+    def test_stitching_rejects_mismatched_output(self, stitcher: LeftRightStitcher):
+        """Test that an output buffer of the wrong dtype raises an error."""
+        images = [np.zeros((512, 640), np.uint16)] * 2
+        out = np.zeros(stitcher.virtual_camera.size[::-1], np.uint8)
+        with pytest.raises(ValueError, match="out must be"):
+            stitcher(images, out=out)
+
+
+class TestDisjointTiles:
+    """Test cases for tiles that do not overlap any other tile."""
+
+    @pytest.fixture
+    def stitcher(self):
+        """Create a stitcher whose cameras are too far apart to overlap."""
+        intrinsics = {
+            "width": 64,
+            "height": 48,
+            "fx": 100.0,
+            "fy": 100.0,
+            "cx": 31.5,
+            "cy": 23.5,
+            "roll": 0.0,
+            "pitch": 0.0,
+        }
+        return HorizontalStitcher(
+            [
+                PinholeCamera(yaw=-20.0, **intrinsics),
+                PinholeCamera(yaw=20.0, **intrinsics),
+            ]
+        )
+
+    def test_weights_equal_mask(self, stitcher: HorizontalStitcher):
+        """Test that exclusive tiles get unit weights wherever they are valid."""
+        assert len(stitcher.tiles) == 2
+        assert stitcher.tiles[0].rect.intersect(stitcher.tiles[1].rect) is None
+        for tile in stitcher.tiles:
+            np.testing.assert_array_equal(tile.weights, tile.mask)
+
+    @pytest.mark.parametrize("compensator", [NoOpCompensator(), AdditiveCompensator()])
+    def test_stitching_copies_valid_pixels(
+        self, stitcher: HorizontalStitcher, compensator: ExposureCompensator
+    ):
+        """Test that exclusive tiles are written as-is, zero outside their mask."""
+        stitcher.compensator = compensator
+        images = [
+            np.full((48, 64), 1000, np.uint16),
+            np.full((48, 64), 3000, np.uint16),
+        ]
+        stitched = stitcher(images)
+
+        for tile, value in zip(stitcher.tiles, (1000, 3000)):
+            region = stitched[tile.rect.s]
+            np.testing.assert_array_equal(region[tile.mask], value)
+            np.testing.assert_array_equal(region[~tile.mask], 0)
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+    def test_stitching_follows_updated_weights(
+        self, stitcher: HorizontalStitcher, dtype: type
+    ):
+        """Test that weights updated after construction are used for every dtype."""
+        images = [np.full((48, 64), 200, dtype) for _ in range(2)]
+        before = stitcher(images).astype(np.float32)
+        for tile in stitcher.tiles:
+            tile.update_weights(tile.weights / 2)
+        np.testing.assert_allclose(stitcher(images), before / 2, atol=1)
+
+
+class TestAdditiveCompensator:
+    """Test cases for AdditiveCompensator."""
+
+    @staticmethod
+    def make_tile(rect: Rect) -> Tile:
+        """Create a fully valid tile covering rect (maps are unused here)."""
+        shape = (rect.h, rect.w)
+        maps = (np.zeros(shape, np.float32), np.zeros(shape, np.float32))
+        return Tile(
+            rect=rect,
+            maps=maps,
+            mask=np.ones(shape, dtype=bool),
+            weights=np.ones(shape, np.float32),
+        )
+
+    def test_bias_uses_only_jointly_valid_pixels(self):
+        """Test that the bias is the median difference over the shared valid pixels."""
+        tile_i = self.make_tile(Rect(0, 0, 6, 4))
+        tile_j = self.make_tile(Rect(3, 0, 6, 4))
+        tile_j.mask[:, 0] = False  # first overlap column invalid in tile_j
+
+        img_i = np.full((4, 6), 100, np.float32)
+        img_j = np.full((4, 6), 70, np.float32)
+        img_j[:, 0] = 1000  # outlier column, masked out
+
+        bias = AdditiveCompensator._compute_bias_between_tiles(
+            tile_i, tile_j, img_i, img_j
+        )
+        assert bias == pytest.approx(30.0)
+
+    def test_bias_without_overlap_is_zero(self):
+        """Test that disjoint tiles produce no correction."""
+        tile_i = self.make_tile(Rect(0, 0, 4, 4))
+        tile_j = self.make_tile(Rect(10, 0, 4, 4))
+        img = np.zeros((4, 4), np.float32)
+
+        bias = AdditiveCompensator._compute_bias_between_tiles(tile_i, tile_j, img, img)
+        assert bias == 0.0
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+    @pytest.mark.parametrize("width", [5, 6])
+    def test_bias_matches_numpy_median(self, dtype: type, width: int):
+        """Test that the bias equals the exact median difference for any dtype."""
+        rng = np.random.default_rng(width)
+        tile = self.make_tile(Rect(0, 0, width, 101))
+        img_i = rng.integers(0, 255, (101, width)).astype(dtype)
+        img_j = rng.integers(0, 255, (101, width)).astype(dtype)
+
+        bias = AdditiveCompensator._compute_bias_between_tiles(tile, tile, img_i, img_j)
+        assert bias == np.median(img_i) - np.median(img_j)
+
+    def test_biases_chain_to_reference(self):
+        """Test that each bias corrects an image to the corrected previous one."""
+        tiles = [self.make_tile(Rect(3 * i, 0, 6, 4)) for i in range(3)]
+        images = [np.full((4, 6), value, np.uint16) for value in (100, 70, 90)]
+
+        compensator = AdditiveCompensator()
+        assert compensator.biases(tiles, images) == [0.0, 30.0, 10.0]
+        corrected = compensator(tiles, images)
+        for image in corrected:
+            np.testing.assert_array_equal(image, 100)
+        assert corrected[0] is images[0]
+
+    def test_unbiased_images_are_not_copied(self):
+        """Test that images needing no correction are passed through as-is."""
+        tiles = [self.make_tile(Rect(3 * i, 0, 6, 4)) for i in range(2)]
+        images = [np.full((4, 6), 100, np.uint16) for _ in range(2)]
+
+        corrected = AdditiveCompensator()(tiles, images)
+        assert all(c is i for c, i in zip(corrected, images))
+
+    def test_overlap_cache_does_not_keep_tiles_alive(self):
+        """Test that cached overlaps are dropped once their tiles are freed."""
+        compensator = AdditiveCompensator()
+        tiles = [self.make_tile(Rect(3 * i, 0, 6, 4)) for i in range(2)]
+        images = [np.full((4, 6), value, np.uint16) for value in (100, 70)]
+        compensator.biases(tiles, images)
+        ref = weakref.ref(tiles[0])
+
+        del tiles
+        gc.collect()
+        assert ref() is None
+        assert not compensator._overlap_cache
+
+    def test_overlap_cache_follows_replaced_mask(self):
+        """Test that replacing a tile's mask invalidates its cached overlap."""
+        compensator = AdditiveCompensator()
+        tiles = [self.make_tile(Rect(3 * i, 0, 6, 4)) for i in range(2)]
+        images = [np.full((4, 6), 100, np.uint16), np.full((4, 6), 70, np.uint16)]
+        images[1][:, :2] = 1000  # outliers, valid at first
+        assert compensator.biases(tiles, images)[1] == -900.0
+
+        mask = np.ones((4, 6), dtype=bool)
+        mask[:, :2] = False
+        tiles[1].mask = mask
+        assert compensator.biases(tiles, images)[1] == 30.0
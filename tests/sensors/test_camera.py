@@ -110,3 +110,25 @@ class TestPinholeCamera:
         # Test excessive cropping
         with pytest.raises(ValueError, match="Crop exceeds image bounds"):
             self.camera.crop(left=0, top=0, right=640, bottom=0)
+
+    def test_maps_from_matches_homography(self):
+        """Test that the remap maps invert the source-to-target homography."""
+        src = PinholeCamera(
+            width=64, height=48, fx=80.0, fy=80.0, cx=31.5, cy=23.5,
+            roll=2.0, pitch=-3.0, yaw=10.0,
+        )  # fmt: skip
+        dst = PinholeCamera(
+            width=96, height=40, fx=90.0, fy=90.0, cx=47.5, cy=19.5,
+            roll=0.0, pitch=0.0, yaw=0.0,
+        )  # fmt: skip
+
+        mapx, mapy = dst.maps_from(src)
+        assert mapx.shape == mapy.shape == (40, 96)
+        assert mapx.dtype == mapy.dtype == np.float32
+
+        # Every target pixel must map back onto itself through the homography
+        pts = np.stack([mapx.ravel(), mapy.ravel(), np.ones(mapx.size)])
+        projected = src.compute_homography_to(dst) @ pts
+        xs, ys = np.meshgrid(np.arange(96), np.arange(40))
+        np.testing.assert_allclose(projected[0] / projected[2], xs.ravel(), atol=1e-2)
+        np.testing.assert_allclose(projected[1] / projected[2], ys.ravel(), atol=1e-2)